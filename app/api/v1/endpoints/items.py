@@ -1,24 +1,37 @@
-from fastapi import APIRouter, Request
+from fastapi import APIRouter, HTTPException, Query, Request
 
+from app.config import get_settings
+from app.item_store import get_item_store
 from app.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+settings = get_settings()
+
 router = APIRouter()
 
 
 @router.get("/")
-async def list_items(request: Request):
-    """List all items"""
+async def list_items(
+    request: Request,
+    offset: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=1000),
+):
+    """List items, paginated with offset/limit"""
     logger.info(
         "Listing items",
         extra={
             "endpoint": "/items",
             "method": "GET",
+            "offset": offset,
+            "limit": limit,
             "client_ip": request.client.host if request.client else "unknown",
         },
     )
-    items = []
+    if settings.items_backend == "compact":
+        items = get_item_store().page(offset, limit)
+    else:
+        items = []
     logger.debug(f"Returning {len(items)} items")
     return {"items": items}
 
@@ -35,14 +48,24 @@ async def get_item(item_id: int, request: Request):
             "client_ip": request.client.host if request.client else "unknown",
         },
     )
-    item = {"item_id": item_id, "name": f"Item {item_id}"}
+    if settings.items_backend == "compact":
+        item = get_item_store().get(item_id)
+        if item is None:
+            raise HTTPException(status_code=404, detail="Item not found")
+    else:
+        item = {"item_id": item_id, "name": f"Item {item_id}"}
     logger.debug(f"Item retrieved: {item}")
     return item
 
 
 @router.post("/")
 async def create_item(item: dict, request: Request):
-    """Create a new item"""
+    """
+    Create a new item.
+
+    With the compact backend, item_id is optional (the next free ID is used)
+    and creating an item whose ID already exists returns 409.
+    """
     logger.info(
         "Creating item",
         extra={
@@ -52,6 +75,20 @@ async def create_item(item: dict, request: Request):
             "client_ip": request.client.host if request.client else "unknown",
         },
     )
+    if settings.items_backend == "compact":
+        name = item.get("name")
+        if not isinstance(name, str):
+            raise HTTPException(status_code=422, detail="Item name must be a string")
+        store = get_item_store()
+        item_id = item["item_id"] if "item_id" in item else store.next_id()
+        if not isinstance(item_id, int) or isinstance(item_id, bool):
+            raise HTTPException(status_code=422, detail="Item ID must be an integer")
+        if item_id in store:
+            raise HTTPException(status_code=409, detail="Item already exists")
+        try:
+            item = store.put(item_id, name)
+        except ValueError as e:
+            raise HTTPException(status_code=422, detail=str(e))
     created_item = {"message": "Item created", "item": item}
     logger.info(f"Item created successfully: {created_item}")
     return created_item
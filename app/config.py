@@ -36,6 +36,10 @@ class Settings(BaseSettings):
     algorithm: str = "HS256"
     access_token_expire_minutes: int = 30
 
+    # Items storage
+    items_backend: Literal["stub", "compact"] = "stub"  # "compact" keeps items in memory
+    items_snapshot_path: str = ""  # Snapshot file for warm restarts (compact backend only)
+
     # Logging
     log_level: str = "INFO"
     log_format: str = "json"  # "json" for prod, "text" for dev
@@ -0,0 +1,215 @@
+"""
+Compact in-memory storage engine for items.
+
+Items are kept column-wise instead of as one dict per item: item IDs live in a
+packed ``array('q')``, names in a list of interned strings, and a single dict
+maps each item ID to its row. This gives O(1) lookup by ``item_id`` and cheap
+insertion-ordered iteration for pagination, at a fraction of the memory of a
+dict-of-dicts store.
+
+The store can optionally be snapshotted to a flat binary file for warm
+restarts; the ID and offset columns load straight into arrays without
+per-item parsing.
+"""
+
+import os
+import struct
+import sys
+from array import array
+from functools import lru_cache
+from typing import Dict, Iterator, List, Optional, Tuple
+
+# Snapshot layout (little-endian):
+#   header:  magic (8 bytes), item count (uint64), name blob length (uint64)
+#   ids:     count * int64
+#   offsets: (count + 1) * int64, byte offsets of each name inside the blob
+#   blob:    UTF-8 encoded names, concatenated
+SNAPSHOT_MAGIC = b"ITEMSNP1"
+_HEADER = struct.Struct("<8sQQ")
+_INT64 = 8
+MIN_ID = -(2**63)
+MAX_ID = 2**63 - 1
+
+
+class SnapshotError(ValueError):
+    """Raised when a snapshot file is missing data or has an unknown format."""
+
+
+class ItemStore:
+    """
+    Column-oriented item store.
+
+    Rows are appended in insertion order; updating an existing item replaces
+    its name in place, so pagination order stays stable.
+    """
+
+    __slots__ = ("_ids", "_names", "_index", "_max_id")
+
+    def __init__(self) -> None:
+        self._ids: array = array("q")
+        self._names: List[str] = []
+        self._index: Dict[int, int] = {}
+        self._max_id: Optional[int] = None
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, item_id: object) -> bool:
+        return item_id in self._index
+
+    def put(self, item_id: int, name: str) -> Dict[str, object]:
+        """
+        Insert or update an item.
+
+        Args:
+            item_id: Item identifier (signed 64-bit integer)
+            name: Item name
+
+        Returns:
+            The stored item as a response dict
+
+        Raises:
+            ValueError: If item_id does not fit in a signed 64-bit integer
+        """
+        if not MIN_ID <= item_id <= MAX_ID:
+            raise ValueError(f"Item ID {item_id} is outside the 64-bit range")
+        name = sys.intern(name)
+        row = self._index.get(item_id)
+        if row is None:
+            self._ids.append(item_id)
+            self._names.append(name)
+            self._index[item_id] = len(self._ids) - 1
+            if self._max_id is None or item_id > self._max_id:
+                self._max_id = item_id
+        else:
+            self._names[row] = name
+        return {"item_id": item_id, "name": name}
+
+    def get(self, item_id: int) -> Optional[Dict[str, object]]:
+        """Return the item with the given ID, or None if it does not exist."""
+        row = self._index.get(item_id)
+        if row is None:
+            return None
+        return {"item_id": item_id, "name": self._names[row]}
+
+    def next_id(self) -> int:
+        """Return an item ID one greater than the largest stored ID."""
+        return self._max_id + 1 if self._max_id is not None else 1
+
+    def items(self) -> Iterator[Tuple[int, str]]:
+        """Iterate over ``(item_id, name)`` pairs in insertion order."""
+        return zip(self._ids, self._names)
+
+    def page(self, offset: int = 0, limit: int = 100) -> List[Dict[str, object]]:
+        """
+        Return a page of items in insertion order.
+
+        Args:
+            offset: Number of items to skip
+            limit: Maximum number of items to return
+
+        Returns:
+            List of item response dicts
+        """
+        end = offset + limit
+        return [
+            {"item_id": item_id, "name": name}
+            for item_id, name in zip(self._ids[offset:end], self._names[offset:end])
+        ]
+
+    def save_snapshot(self, path: str) -> None:
+        """
+        Write the store to ``path``.
+
+        The file is written next to the target and atomically renamed into
+        place, so a crash mid-write never leaves a truncated snapshot behind.
+        """
+        encoded = [name.encode("utf-8") for name in self._names]
+        offsets = array("q", [0])
+        total = 0
+        for chunk in encoded:
+            total += len(chunk)
+            offsets.append(total)
+
+        ids = array("q", self._ids)
+        if sys.byteorder != "little":
+            ids.byteswap()
+            offsets.byteswap()
+
+        tmp_path = f"{path}.tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(_HEADER.pack(SNAPSHOT_MAGIC, len(ids), total))
+                ids.tofile(f)
+                offsets.tofile(f)
+                for chunk in encoded:
+                    f.write(chunk)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, path)
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def load_snapshot(self, path: str) -> None:
+        """
+        Replace the store contents with a snapshot written by :meth:`save_snapshot`.
+
+        The file is read in one call and the ID and offset columns are copied
+        straight into their arrays; names are decoded eagerly, since they are
+        served as ``str``. The store is left untouched if the snapshot is invalid.
+
+        Raises:
+            SnapshotError: If the file is truncated, corrupt or not a snapshot
+        """
+        with open(path, "rb") as f:
+            data = f.read()
+        if len(data) < _HEADER.size:
+            raise SnapshotError(f"Snapshot {path} is truncated")
+        magic, count, blob_len = _HEADER.unpack_from(data, 0)
+        if magic != SNAPSHOT_MAGIC:
+            raise SnapshotError(f"Snapshot {path} has unknown format")
+
+        ids_start = _HEADER.size
+        offsets_start = ids_start + count * _INT64
+        blob_start = offsets_start + (count + 1) * _INT64
+        if len(data) != blob_start + blob_len:
+            raise SnapshotError(f"Snapshot {path} is truncated")
+
+        view = memoryview(data)
+        ids = array("q", view[ids_start:offsets_start].tobytes())
+        offsets = array("q", view[offsets_start:blob_start].tobytes())
+        if sys.byteorder != "little":
+            ids.byteswap()
+            offsets.byteswap()
+
+        if offsets[0] != 0 or offsets[-1] != blob_len:
+            raise SnapshotError(f"Snapshot {path} has corrupt name offsets")
+        if any(start > end for start, end in zip(offsets, offsets[1:])):
+            raise SnapshotError(f"Snapshot {path} has corrupt name offsets")
+
+        blob = data[blob_start:]
+        intern = sys.intern
+        try:
+            names = [
+                intern(blob[start:end].decode("utf-8"))
+                for start, end in zip(offsets, offsets[1:])
+            ]
+        except UnicodeDecodeError as e:
+            raise SnapshotError(f"Snapshot {path} has invalid name data") from e
+
+        index = {item_id: row for row, item_id in enumerate(ids)}
+        if len(index) != count:
+            raise SnapshotError(f"Snapshot {path} has duplicate item IDs")
+
+        self._ids = ids
+        self._names = names
+        self._index = index
+        self._max_id = max(ids) if ids else None
+
+
+@lru_cache()
+def get_item_store() -> ItemStore:
+    """Get the process-wide item store (cached)."""
+    return ItemStore()
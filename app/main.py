@@ -1,3 +1,5 @@
+import os
+
 import sentry_sdk
 from fastapi import FastAPI, Request, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
@@ -6,6 +8,7 @@ from sentry_sdk.integrations.fastapi import FastApiIntegration
 from sentry_sdk.integrations.logging import LoggingIntegration
 from app.api.v1.router import api_router
 from app.config import get_settings
+from app.item_store import SnapshotError, get_item_store
 from app.logging_config import setup_logging, get_logger
 from app.middleware import LoggingMiddleware
 
@@ -153,10 +156,31 @@ async def startup_event():
         },
     )
 
+    if settings.items_backend == "compact" and settings.items_snapshot_path:
+        if os.path.exists(settings.items_snapshot_path):
+            store = get_item_store()
+            try:
+                store.load_snapshot(settings.items_snapshot_path)
+            except (SnapshotError, OSError):
+                # Fail startup rather than run empty: the shutdown snapshot
+                # would otherwise overwrite the unreadable file and lose its items
+                logger.exception(
+                    "Item snapshot load failed",
+                    extra={"path": settings.items_snapshot_path},
+                )
+                raise
+            logger.info(
+                "Item snapshot loaded",
+                extra={
+                    "path": settings.items_snapshot_path,
+                    "item_count": len(store),
+                },
+            )
+
 
 @app.on_event("shutdown")
 async def shutdown_event():
-    """Log application shutdown."""
+    """Log application shutdown and snapshot the item store if configured."""
     logger.info(
         "Application shutting down",
         extra={
@@ -165,6 +189,24 @@ async def shutdown_event():
         },
     )
 
+    if settings.items_backend == "compact" and settings.items_snapshot_path:
+        store = get_item_store()
+        try:
+            store.save_snapshot(settings.items_snapshot_path)
+        except OSError:
+            logger.exception(
+                "Item snapshot save failed",
+                extra={"path": settings.items_snapshot_path},
+            )
+        else:
+            logger.info(
+                "Item snapshot saved",
+                extra={
+                    "path": settings.items_snapshot_path,
+                    "item_count": len(store),
+                },
+            )
+
 
 @app.get("/")
 async def root(request: Request):
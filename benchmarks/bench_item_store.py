@@ -0,0 +1,90 @@
+"""
+Benchmark the compact item store against a plain dict-of-dicts store.
+
+Reports memory per item (via tracemalloc), random lookup latency, and
+snapshot save/load times for the compact store.
+
+Usage:
+    python -m benchmarks.bench_item_store [item_count]
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+import timeit
+import tracemalloc
+from typing import Callable, Dict
+
+from app.item_store import ItemStore
+
+NAMES = ["Widget", "Gadget", "Sprocket", "Gizmo", "Doohickey"]
+
+
+def build_dict_store(count: int) -> Dict[int, dict]:
+    """Build the baseline store: one dict per item, keyed by item ID."""
+    store = {}
+    for item_id in range(1, count + 1):
+        store[item_id] = {"item_id": item_id, "name": NAMES[item_id % len(NAMES)]}
+    return store
+
+
+def build_compact_store(count: int) -> ItemStore:
+    """Build a compact store with the same contents as the baseline."""
+    store = ItemStore()
+    for item_id in range(1, count + 1):
+        store.put(item_id, NAMES[item_id % len(NAMES)])
+    return store
+
+
+def measure_memory(build: Callable[[int], object], count: int) -> float:
+    """Return bytes allocated per item while building a store."""
+    tracemalloc.start()
+    store = build(count)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del store
+    return current / count
+
+
+def measure_lookup(lookup: Callable[[int], object], count: int) -> float:
+    """Return mean lookup latency in nanoseconds over random IDs."""
+    keys = [random.randint(1, count) for _ in range(100_000)]
+
+    def run() -> None:
+        for key in keys:
+            lookup(key)
+
+    best = min(timeit.repeat(run, number=1, repeat=5))
+    return best / len(keys) * 1e9
+
+
+def main(count: int) -> None:
+    random.seed(0)
+    print(f"Items: {count:,}")
+
+    dict_bytes = measure_memory(build_dict_store, count)
+    compact_bytes = measure_memory(build_compact_store, count)
+    print(f"Memory per item   dict-of-dicts: {dict_bytes:8.1f} B")
+    print(f"Memory per item   compact:       {compact_bytes:8.1f} B")
+
+    dict_store = build_dict_store(count)
+    compact_store = build_compact_store(count)
+    print(f"Lookup latency    dict-of-dicts: {measure_lookup(dict_store.get, count):8.1f} ns")
+    print(f"Lookup latency    compact:       {measure_lookup(compact_store.get, count):8.1f} ns")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "items.snap")
+        start = time.perf_counter()
+        compact_store.save_snapshot(path)
+        saved = time.perf_counter() - start
+        start = time.perf_counter()
+        ItemStore().load_snapshot(path)
+        loaded = time.perf_counter() - start
+        print(f"Snapshot save:                   {saved * 1000:8.1f} ms")
+        print(f"Snapshot load:                   {loaded * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
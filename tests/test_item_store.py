@@ -0,0 +1,136 @@
+import pytest
+from app.item_store import ItemStore, SnapshotError
+
+
+def test_put_and_get():
+    """Test items can be stored and looked up by ID"""
+    store = ItemStore()
+    assert store.put(7, "Widget") == {"item_id": 7, "name": "Widget"}
+    assert store.get(7) == {"item_id": 7, "name": "Widget"}
+    assert store.get(8) is None
+    assert 7 in store
+    assert len(store) == 1
+
+
+def test_put_existing_item_updates_in_place():
+    """Test updating an item keeps its position in iteration order"""
+    store = ItemStore()
+    store.put(1, "a")
+    store.put(2, "b")
+    store.put(1, "c")
+    assert len(store) == 2
+    assert list(store.items()) == [(1, "c"), (2, "b")]
+
+
+def test_page():
+    """Test pagination returns items in insertion order"""
+    store = ItemStore()
+    for item_id in range(10, 0, -1):
+        store.put(item_id, f"Item {item_id}")
+    page = store.page(offset=2, limit=3)
+    assert [item["item_id"] for item in page] == [8, 7, 6]
+    assert store.page(offset=20, limit=5) == []
+
+
+def test_next_id():
+    """Test next_id continues after the largest stored ID"""
+    store = ItemStore()
+    assert store.next_id() == 1
+    store.put(5, "x")
+    store.put(2, "y")
+    assert store.next_id() == 6
+
+
+def test_snapshot_round_trip(tmp_path):
+    """Test a saved snapshot restores the same items and order"""
+    store = ItemStore()
+    store.put(3, "three")
+    store.put(-1, "")
+    store.put(2**40, "ünïcode ✓")
+    path = str(tmp_path / "items.snap")
+    store.save_snapshot(path)
+
+    restored = ItemStore()
+    restored.put(99, "discarded")
+    restored.load_snapshot(path)
+    assert list(restored.items()) == list(store.items())
+    assert restored.get(2**40) == {"item_id": 2**40, "name": "ünïcode ✓"}
+    assert restored.get(99) is None
+
+
+def test_snapshot_empty_store(tmp_path):
+    """Test an empty store round-trips through a snapshot"""
+    path = str(tmp_path / "items.snap")
+    ItemStore().save_snapshot(path)
+    restored = ItemStore()
+    restored.load_snapshot(path)
+    assert len(restored) == 0
+
+
+def test_snapshot_rejects_bad_files(tmp_path):
+    """Test corrupt or truncated snapshots raise SnapshotError"""
+    path = tmp_path / "items.snap"
+    path.write_bytes(b"not a snapshot at all, definitely not")
+    with pytest.raises(SnapshotError):
+        ItemStore().load_snapshot(str(path))
+
+    store = ItemStore()
+    store.put(1, "one")
+    store.save_snapshot(str(path))
+    path.write_bytes(path.read_bytes()[:-1])
+    with pytest.raises(SnapshotError):
+        ItemStore().load_snapshot(str(path))
+
+
+def test_put_rejects_out_of_range_ids():
+    """Test IDs that do not fit in 64 bits raise ValueError"""
+    store = ItemStore()
+    with pytest.raises(ValueError):
+        store.put(2**63, "x")
+    with pytest.raises(ValueError):
+        store.put(-(2**63) - 1, "x")
+    assert len(store) == 0
+
+
+def test_next_id_after_snapshot_load(tmp_path):
+    """Test next_id accounts for items restored from a snapshot"""
+    store = ItemStore()
+    store.put(41, "x")
+    path = str(tmp_path / "items.snap")
+    store.save_snapshot(path)
+    restored = ItemStore()
+    restored.load_snapshot(path)
+    assert restored.next_id() == 42
+
+
+def _corrupt(path, offset, data):
+    raw = bytearray(path.read_bytes())
+    raw[offset : offset + len(data)] = data
+    path.write_bytes(bytes(raw))
+
+
+def test_snapshot_rejects_corrupt_contents(tmp_path):
+    """Test corrupt offsets, names and duplicate IDs raise SnapshotError"""
+    path = tmp_path / "items.snap"
+    store = ItemStore()
+    store.put(1, "ab")
+    store.put(2, "cd")
+    header, ids_end = 24, 24 + 2 * 8
+
+    store.save_snapshot(str(path))
+    _corrupt(path, ids_end + 8, (5).to_bytes(8, "little"))
+    with pytest.raises(SnapshotError):
+        ItemStore().load_snapshot(str(path))
+
+    store.save_snapshot(str(path))
+    _corrupt(path, ids_end + 3 * 8, b"\xff")
+    with pytest.raises(SnapshotError):
+        ItemStore().load_snapshot(str(path))
+
+    store.save_snapshot(str(path))
+    _corrupt(path, header + 8, (1).to_bytes(8, "little"))
+    restored = ItemStore()
+    restored.put(5, "kept")
+    with pytest.raises(SnapshotError):
+        restored.load_snapshot(str(path))
+    assert list(restored.items()) == [(5, "kept")]
@@ -0,0 +1,137 @@
+import pytest
+from fastapi.testclient import TestClient
+from app import main
+from app.api.v1.endpoints import items
+from app.item_store import ItemStore, SnapshotError, get_item_store
+from app.main import app
+
+client = TestClient(app)
+
+
+@pytest.fixture
+def compact_backend(monkeypatch):
+    """Switch the items endpoints to a fresh compact store"""
+    monkeypatch.setattr(items.settings, "items_backend", "compact")
+    monkeypatch.setattr(main.settings, "items_backend", "compact")
+    get_item_store.cache_clear()
+    yield get_item_store()
+    get_item_store.cache_clear()
+
+
+def test_stub_backend_get_item():
+    """Test the default backend returns a placeholder item"""
+    response = client.get("/api/v1/items/3")
+    assert response.status_code == 200
+    assert response.json() == {"item_id": 3, "name": "Item 3"}
+
+
+def test_create_and_get_item(compact_backend):
+    """Test items created via POST can be fetched back"""
+    response = client.post("/api/v1/items/", json={"item_id": 5, "name": "Widget"})
+    assert response.status_code == 200
+    assert response.json()["item"] == {"item_id": 5, "name": "Widget"}
+
+    response = client.get("/api/v1/items/5")
+    assert response.status_code == 200
+    assert response.json() == {"item_id": 5, "name": "Widget"}
+
+
+def test_create_item_assigns_next_id(compact_backend):
+    """Test item_id defaults to one past the largest stored ID"""
+    compact_backend.put(10, "existing")
+    response = client.post("/api/v1/items/", json={"name": "Gadget"})
+    assert response.status_code == 200
+    assert response.json()["item"] == {"item_id": 11, "name": "Gadget"}
+
+
+def test_create_existing_item_conflicts(compact_backend):
+    """Test creating an item with an existing ID returns 409"""
+    compact_backend.put(1, "original")
+    response = client.post("/api/v1/items/", json={"item_id": 1, "name": "other"})
+    assert response.status_code == 409
+    assert compact_backend.get(1) == {"item_id": 1, "name": "original"}
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        {"item_id": 1},
+        {"item_id": 1, "name": 2},
+        {"item_id": "1", "name": "x"},
+        {"item_id": True, "name": "x"},
+        {"item_id": 2**63, "name": "x"},
+    ],
+)
+def test_create_item_rejects_invalid_body(compact_backend, body):
+    """Test invalid names and IDs return 422"""
+    response = client.post("/api/v1/items/", json=body)
+    assert response.status_code == 422
+    assert len(compact_backend) == 0
+
+
+def test_get_unknown_item(compact_backend):
+    """Test fetching an unknown item returns 404"""
+    response = client.get("/api/v1/items/404")
+    assert response.status_code == 404
+
+
+def test_list_items_paginates(compact_backend):
+    """Test listing items honours offset and limit"""
+    for item_id in range(1, 6):
+        compact_backend.put(item_id, f"Item {item_id}")
+    response = client.get("/api/v1/items/", params={"offset": 1, "limit": 2})
+    assert response.status_code == 200
+    assert response.json() == {
+        "items": [{"item_id": 2, "name": "Item 2"}, {"item_id": 3, "name": "Item 3"}]
+    }
+
+
+@pytest.mark.parametrize(
+    "params", [{"offset": -1}, {"limit": 0}, {"limit": 1001}]
+)
+def test_list_items_rejects_invalid_pagination(params):
+    """Test out-of-range offset/limit return 422"""
+    response = client.get("/api/v1/items/", params=params)
+    assert response.status_code == 422
+
+
+def test_snapshot_loaded_on_startup_and_saved_on_shutdown(
+    compact_backend, monkeypatch, tmp_path
+):
+    """Test the item snapshot round-trips through the app lifecycle"""
+    path = str(tmp_path / "items.snap")
+    monkeypatch.setattr(main.settings, "items_snapshot_path", path)
+    seed = ItemStore()
+    seed.put(7, "restored")
+    seed.save_snapshot(path)
+
+    with TestClient(app) as lifecycle_client:
+        assert lifecycle_client.get("/api/v1/items/7").json()["name"] == "restored"
+        lifecycle_client.post("/api/v1/items/", json={"item_id": 8, "name": "new"})
+
+    saved = ItemStore()
+    saved.load_snapshot(path)
+    assert list(saved.items()) == [(7, "restored"), (8, "new")]
+
+
+def test_corrupt_snapshot_fails_startup(compact_backend, monkeypatch, tmp_path):
+    """Test a corrupt snapshot stops startup instead of being overwritten"""
+    path = tmp_path / "items.snap"
+    path.write_bytes(b"corrupt")
+    monkeypatch.setattr(main.settings, "items_snapshot_path", str(path))
+
+    with pytest.raises(SnapshotError):
+        with TestClient(app):
+            pass
+    assert path.read_bytes() == b"corrupt"
+
+
+def test_snapshot_save_failure_does_not_break_shutdown(
+    compact_backend, monkeypatch, tmp_path
+):
+    """Test a failed shutdown snapshot is logged rather than raised"""
+    path = str(tmp_path / "missing" / "items.snap")
+    monkeypatch.setattr(main.settings, "items_snapshot_path", path)
+
+    with TestClient(app):
+        pass